@@ -3,8 +3,14 @@ from functools import lru_cache
 
 from fastapi import FastAPI, HTTPException
 
+from src.app.database import mongodb
+from src.app.responses import ORJSONResponse
 from src.app.routes import v1_router
 from src.config import settings
+from src.product.services import ProductService
+from src.users.middleware import AuthMiddleware
+from src.users.services import UserService
+from src.users.utils.password import warmup as warmup_auth
 
 
 # Caching settings for efficient access
@@ -18,12 +24,24 @@ def get_settings():
 async def lifespan(app: FastAPI):
     print(f"FastAPI running in {get_settings().fastapi_env} environment")
 
+    # Create the MongoDB client inside the running loop and warm its connection pool
+    await mongodb.connect()
+
+    # Ensure the indexes used by auth lookups and product queries exist
+    await UserService().create_indexes()
+    await ProductService().create_indexes()
+
+    # Pay the one-time bcrypt/JWT setup cost before serving the first login
+    warmup_auth()
+
     # Include API router
     app.include_router(v1_router, prefix="/api")
 
     # Yield control back to FastAPI for the lifespan duration
     yield
 
+    await mongodb.close()
+
 
 # Create FastAPI application instance
 app = FastAPI(
@@ -38,11 +56,12 @@ app = FastAPI(
         "email": get_settings().app.contact.email,
         "url": get_settings().app.contact.url,
     },
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 # setup app middleware here
-# .....
+app.add_middleware(AuthMiddleware)
 
 # setup exception handlers here
 # ....
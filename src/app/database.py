@@ -1,6 +1,7 @@
 import logging
+from typing import Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 from pymongo.errors import ServerSelectionTimeoutError
 from pymongo.server_api import ServerApi
 
@@ -10,25 +11,55 @@ from src.config import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class MongoDBMotorClient:
-    _instance = None
+# Documents fetched per getMore round-trip when materializing whole cursors
+CURSOR_BATCH_SIZE = 1000
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
 
-    def _initialize(self):
+class MongoDBClient:
+    """Holds the AsyncMongoClient; `connect()`/`close()` are driven by the application lifespan."""
+
+    def __init__(self):
+        self.client: Optional[AsyncMongoClient] = None
+        self.db = None
+        self._collections = {}
+
+    async def connect(self):
+        """
+        Create the client inside the running event loop and open the connection pool.
+        """
         database_url = settings.MONGO_URI
         database_name = settings.MONGO_DB_NAME
 
         if not database_url or not database_name:
             raise ValueError("MongoDB URI or database name is missing from environment variables.")
 
+        client_options = {
+            "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+            "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+            "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        }
+        if settings.MONGO_COMPRESSORS:
+            client_options["compressors"] = settings.MONGO_COMPRESSORS
+
         # Connect to MongoDB using the URI and database name
-        self.client = AsyncIOMotorClient(database_url, server_api=ServerApi('1'))
+        # tz_aware: read datetimes back as UTC-aware, matching the aware timestamps we write
+        self.client = AsyncMongoClient(database_url, server_api=ServerApi('1'), tz_aware=True, **client_options)
         self.db = self.client.get_database(database_name)
+        self._collections = {}
+
+        # Ping so the connection pool is warm before the first request
+        await self.ping_server()
+
+    async def close(self):
+        """
+        Close the client and its connection pool.
+        """
+        if self.client is not None:
+            await self.client.close()
+        self.client = None
+        self.db = None
+        self._collections = {}
 
     async def ping_server(self):
         """
@@ -46,4 +77,13 @@ class MongoDBMotorClient:
         """
         Get the collection instance from the database.
         """
-        return self.db.get_collection(collection_name)
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            if self.db is None:
+                raise RuntimeError("MongoDB client is not connected; call connect() first.")
+            collection = self._collections[collection_name] = self.db.get_collection(collection_name)
+        return collection
+
+
+# Application-wide client, connected in the FastAPI lifespan
+mongodb = MongoDBClient()
@@ -0,0 +1,27 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse as BaseORJSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the BSON/Python types orjson does not handle natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(BaseORJSONResponse):
+    """ORJSONResponse that also serializes ObjectId and Decimal values, e.g. raw MongoDB documents."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            # OPT_UTC_Z writes UTC datetimes as "...Z", the same as pydantic's model_dump_json
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        )
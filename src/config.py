@@ -22,8 +22,20 @@ class Settings(BaseSettings):
     # Database
     MONGO_URI: str = os.getenv("MONGO_URI", "mongodb://localhost:27017")
     MONGO_DB_NAME: str = os.getenv("MONGO_DB_NAME", "fastapi_db")
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "your_super_secret_key")
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", 5))
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", 50))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+    MONGO_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 300000))
+    # Comma separated wire compressors, e.g. "zstd,snappy" (requires the matching python packages)
+    MONGO_COMPRESSORS: str = os.getenv("MONGO_COMPRESSORS", "")
+    # Kept as bytes, the form the token signer consumes; pydantic encodes env/.env strings as UTF-8
+    SECRET_KEY: bytes = os.getenv("SECRET_KEY", "your_super_secret_key").encode("utf-8")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
-
+    # bcrypt cost factor (4-31); tune so a hash takes ~250ms on the deployment hardware
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+    # Hash new passwords with Argon2id; existing bcrypt hashes are upgraded on login
+    ARGON2_ENABLED: bool = os.getenv("ARGON2_ENABLED", "false").lower() in ["1", "true", "yes"]
+    # Briefly remember successful password checks (off by default; meant for load tests)
+    VERIFY_CACHE_ENABLED: bool = os.getenv("VERIFY_CACHE_ENABLED", "false").lower() in ["1", "true", "yes"]
 
 settings = Settings()
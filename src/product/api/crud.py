@@ -1,10 +1,10 @@
 from typing import List
 
 from bson import ObjectId
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import ValidationError
 
+from src.app.responses import ORJSONResponse
 from src.product.schemas import ProductCreateSchema, ProductSchema, ProductUpdateSchema
 from src.product.services import ProductService
 from src.users.dependencies.permissions import get_current_user
@@ -13,21 +13,30 @@ product_service = ProductService()
 product_crud_router = APIRouter()
 
 
+def product_response(product: ProductSchema, status_code: int = 200) -> Response:
+    """Serialize a product with its compiled pydantic serializer, skipping FastAPI's response re-validation."""
+    return Response(
+        content=product.model_dump_json(by_alias=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @product_crud_router.post("/products/", response_model=ProductSchema, status_code=201)
 async def create_product(product_schema: ProductCreateSchema, current_user=Depends(get_current_user)):
     """Create a new product with proper error handling."""
     try:
         created_product = await product_service.create_product(current_user, product_schema)
-        return created_product
+        return product_response(created_product, status_code=201)
 
     except ValidationError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={"detail": e.errors()}
         )
 
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": f"Internal server error: {str(e)}"}
         )
@@ -42,101 +51,97 @@ async def get_product(product_id: str):
     product = await product_service.get_product_by_id(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return product_response(product)
 
 
-@product_crud_router.get("/products/", response_model=List[ProductSchema])
+@product_crud_router.get(
+    "/products/",
+    response_model=None,
+    responses={200: {"model": List[ProductSchema]}},
+)
 async def get_all_products():
-    """Get all products."""
-    return await product_service.get_all_products()
+    """Get all products. Documents are encoded as-is, skipping response validation and jsonable_encoder."""
+    return ORJSONResponse(await product_service.get_all_products())
+
+
+async def raise_missing_or_forbidden(product_id: str, action: str):
+    """Explain an owner-filtered write that matched nothing: 403 if the product exists, else 404."""
+    if await product_service.product_exists(product_id):
+        raise HTTPException(status_code=403, detail=f"You do not have permission to {action} this product")
+    raise HTTPException(status_code=404, detail="Product not found")
 
 
 @product_crud_router.put("/products/{product_id}", response_model=ProductSchema)
 async def update_product(product_id: str, update_data: ProductUpdateSchema, current_user=Depends(get_current_user)):
-    """Update a product."""
+    """Update a product owned by the current user."""
     if not ObjectId.is_valid(product_id):
         raise HTTPException(status_code=400, detail="Invalid product ID format")
 
-    product = await product_service.get_product_by_id(product_id)
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
-
-    if str(product.owner_id) != str(current_user.id):
-        raise HTTPException(status_code=403, detail="You do not have permission to update this product")
-
     try:
-        updated_product = await product_service.update_product(product_id, update_data)
-        if not updated_product:
-            return JSONResponse(status_code=404, content={"detail": "Product not found"})
-        return updated_product
+        updated_product = await product_service.update_product(product_id, current_user.id, update_data)
 
     except ValidationError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={"detail": e.errors()}
         )
 
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": f"Internal server error: {str(e)}"}
         )
 
+    if not updated_product:
+        await raise_missing_or_forbidden(product_id, "update")
+    return product_response(updated_product)
+
 
 @product_crud_router.patch("/products/{product_id}", response_model=ProductSchema)
 async def partial_update_product(product_id: str, update_data: dict, current_user=Depends(get_current_user)):
-    """Partially update a product."""
+    """Partially update a product owned by the current user."""
 
     if not ObjectId.is_valid(product_id):
         raise HTTPException(status_code=400, detail="Invalid product ID format")
 
-    product = await product_service.get_product_by_id(product_id)
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
-
-    if str(product.owner_id) != str(current_user.id):
-        raise HTTPException(status_code=403, detail="You do not have permission to update this product")
-
     try:
-        updated_product = await product_service.partial_update_product(product_id, update_data)
-        if not updated_product:
-            return JSONResponse(status_code=404, content={"detail": "Product not found"})
-        return updated_product
+        updated_product = await product_service.partial_update_product(product_id, current_user.id, update_data)
 
     except ValidationError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={"detail": e.errors()}
         )
 
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": f"Internal server error: {str(e)}"}
         )
 
+    if not updated_product:
+        await raise_missing_or_forbidden(product_id, "update")
+    return product_response(updated_product)
+
 
 @product_crud_router.delete("/products/{product_id}")
 async def delete_product(product_id: str, current_user=Depends(get_current_user)):
     if not ObjectId.is_valid(product_id):
         raise HTTPException(status_code=400, detail="Invalid product ID format")
 
-    product = await product_service.get_product_by_id(product_id)
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
-
-    # Ensure the product belongs to the current user
-    if str(product.owner_id) != str(current_user.id):
-        raise HTTPException(status_code=403, detail="You do not have permission to delete this product")
-
-    success = await product_service.delete_product(product_id)
+    # The owner filter makes the delete atomic with the permission check
+    success = await product_service.delete_product(product_id, current_user.id)
     if not success:
-        raise HTTPException(status_code=500, detail="Failed to delete product")
+        await raise_missing_or_forbidden(product_id, "delete")
 
-    return JSONResponse(content={"message": "Product deleted successfully"})
+    return ORJSONResponse(content={"message": "Product deleted successfully"})
 
 
-@product_crud_router.get("/products/search/{name}", response_model=List[ProductSchema])
+@product_crud_router.get(
+    "/products/search/{name}",
+    response_model=None,
+    responses={200: {"model": List[ProductSchema]}},
+)
 async def search_products(name: str):
-    """Search products by name."""
-    return await product_service.get_products_by_name(name)
+    """Search products by name. Documents are encoded as-is, skipping response validation and jsonable_encoder."""
+    return ORJSONResponse(await product_service.get_products_by_name(name))
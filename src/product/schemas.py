@@ -1,38 +1,19 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
 
-from pydantic import BaseModel, Field, condecimal, constr, field_validator
+from pydantic import BaseModel, ConfigDict, Field, condecimal, constr
 
 
 class ProductBaseSchema(BaseModel):
     """Base schema for product validation."""
+    model_config = ConfigDict(extra="ignore")
+
     name: constr(min_length=3, max_length=50) = Field(..., description="The name of the product.")
-    description: Optional[str] = Field(None, description="A detailed description of the product.")
+    description: Optional[constr(max_length=500)] = Field(None, description="A detailed description of the product.")
     price: condecimal(gt=0, max_digits=10, decimal_places=2) = Field(..., description="The price of the product.")
     stock: Optional[int] = Field(0, ge=0, description="The number of items available in stock.")
 
-    @field_validator("description")
-    @classmethod
-    def validate_description(cls, value: Optional[str]) -> Optional[str]:
-        if value and len(value) > 500:
-            raise ValueError("Product description must not exceed 500 characters.")
-        return value
-
-    @field_validator("price")
-    @classmethod
-    def validate_price(cls, value):
-        """Ensure price is a positive value."""
-        if value <= 0:
-            raise ValueError("Price must be greater than zero.")
-        return value
-
-    @field_validator("stock")
-    @classmethod
-    def validate_stock(cls, value: int) -> int:
-        if value < 0:
-            raise ValueError("Stock cannot be negative.")
-        return value
-
 
 class ProductCreateSchema(ProductBaseSchema):
     """Schema for creating a new product."""
@@ -41,9 +22,9 @@ class ProductCreateSchema(ProductBaseSchema):
 
 class ProductUpdateSchema(ProductBaseSchema):
     name: Optional[str] = None
-    description: Optional[str] = None
+    description: Optional[constr(max_length=500)] = None
     price: Optional[condecimal(gt=0, max_digits=10, decimal_places=2)] = None
-    stock: Optional[int] = None
+    stock: Optional[int] = Field(None, ge=0)
 
 
 class ProductSchema(ProductBaseSchema):
@@ -51,12 +32,12 @@ class ProductSchema(ProductBaseSchema):
     id: Optional[str] = Field(None, alias="_id", description="MongoDB ObjectId as a string")
     owner_id: str = Field(..., description="The ID of the owner of the product.")
     is_active: bool = Field(True, description="Whether the product is active or not.")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when the product was created.")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when the product was last updated.")
+    created_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc), description="Timestamp when the product was created.")
+    updated_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc), description="Timestamp when the product was last updated.")
 
     def update_timestamps(self):
         """Update the `updated_at` field with the current timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
 
     @property
     def is_in_stock(self) -> bool:
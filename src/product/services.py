@@ -1,21 +1,50 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List, Optional
 
 from bson import ObjectId, errors
 from fastapi import HTTPException
-from pymongo import ReturnDocument
+from pymongo import TEXT, ReturnDocument
 from pymongo.errors import PyMongoError
 
-from src.app.database import MongoDBMotorClient
+from src.app.database import CURSOR_BATCH_SIZE, mongodb
 from src.product.schemas import ProductSchema, ProductCreateSchema, ProductUpdateSchema
 
+# Fields returned by the list/search endpoints; `_id` is always included by MongoDB
+PRODUCT_LIST_PROJECTION = {
+    "name": 1,
+    "description": 1,
+    "price": 1,
+    "stock": 1,
+    "owner_id": 1,
+    "is_active": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+# ProductSchema defaults for fields `create_product` leaves out of the stored document
+PRODUCT_LIST_DEFAULTS = {"description": None, "stock": 0, "is_active": True}
+
+
+def to_product_row(product: dict) -> dict:
+    """Shape a raw list/search document the way ProductSchema serializes it: defaults filled in, price as a decimal string."""
+    for field, default in PRODUCT_LIST_DEFAULTS.items():
+        product.setdefault(field, default)
+    if product.get("price") is not None:
+        product["price"] = str(Decimal(str(product["price"])))
+    return product
+
 
 class ProductService:
-    def __init__(self):
-        """Initialize ProductService with a MongoDBMotorClient instance."""
-        self.db = MongoDBMotorClient().db
-        self.collection = self.db.get_collection("products")
+    @property
+    def collection(self):
+        """The `products` collection of the lifespan-managed MongoDB client."""
+        return mongodb.get_collection("products")
+
+    async def create_indexes(self):
+        """Create the indexes backing owner lookups and name search."""
+        await self.collection.create_index("owner_id")
+        await self.collection.create_index([("name", TEXT)])
 
     @staticmethod
     async def is_object_id(id: str):
@@ -36,7 +65,7 @@ class ProductService:
                 product_dict["price"] = float(product_dict["price"])
 
             # Assign timestamps
-            product_dict["created_at"] = product_dict["updated_at"] = datetime.utcnow()
+            product_dict["created_at"] = product_dict["updated_at"] = datetime.now(timezone.utc)
             product_dict["owner_id"] = str(current_user.id)
 
             result = await self.collection.insert_one(product_dict)
@@ -57,18 +86,26 @@ class ProductService:
         except (PyMongoError, ValueError) as e:
             raise Exception(f"Error fetching product by ID: {e}")
 
-    async def get_all_products(self) -> List[ProductSchema]:
-        """Retrieve all products from the database."""
+    async def get_all_products(self) -> List[dict]:
+        """Retrieve all products from the database as raw documents, ready for serialization."""
         try:
-            return [
-                ProductSchema(**{**product, "_id": str(product["_id"])})
-                async for product in self.collection.find()
-            ]
+            cursor = self.collection.find({}, projection=PRODUCT_LIST_PROJECTION).batch_size(CURSOR_BATCH_SIZE)
+            # ObjectIds are stringified by the ORJSONResponse encoder
+            return [to_product_row(product) for product in await cursor.to_list(length=None)]
         except PyMongoError as e:
             raise Exception(f"Database error while fetching products: {e}")
 
-    async def update_product(self, product_id: str, update_data: ProductUpdateSchema) -> Optional[ProductSchema]:
-        """Update a product's details."""
+    async def product_exists(self, product_id: str) -> bool:
+        """Check whether a product with the given ID exists."""
+        try:
+            return await self.collection.count_documents({"_id": ObjectId(product_id)}, limit=1) > 0
+        except (PyMongoError, ValueError) as e:
+            raise Exception(f"Error checking product existence: {e}")
+
+    async def update_product(
+        self, product_id: str, owner_id: str, update_data: ProductUpdateSchema
+    ) -> Optional[ProductSchema]:
+        """Update a product's details if it belongs to `owner_id`; None when nothing matched."""
         try:
             if not ObjectId.is_valid(product_id):
                 raise ValueError("Invalid product ID format")
@@ -78,10 +115,10 @@ class ProductService:
             if "price" in update_dict and isinstance(update_dict["price"], Decimal):
                 update_dict["price"] = float(update_dict["price"])
 
-            update_dict["updated_at"] = datetime.utcnow()
+            update_dict["updated_at"] = datetime.now(timezone.utc)
 
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(product_id)},
+                {"_id": ObjectId(product_id), "owner_id": str(owner_id)},
                 {"$set": update_dict},
                 return_document=ReturnDocument.AFTER
             )
@@ -90,13 +127,13 @@ class ProductService:
                 result["_id"] = str(result["_id"])
                 return ProductSchema(**result)
 
-            return None  # Product not found
+            return None  # Product not found or not owned by owner_id
 
         except (errors.InvalidId, PyMongoError, ValueError) as e:
             raise Exception(f"Error updating product: {e}")
 
-    async def partial_update_product(self, product_id: str, update_data: dict) -> Optional[ProductSchema]:
-        """Partially update a product's details."""
+    async def partial_update_product(self, product_id: str, owner_id: str, update_data: dict) -> Optional[ProductSchema]:
+        """Partially update a product's details if it belongs to `owner_id`; None when nothing matched."""
         try:
             if not ObjectId.is_valid(product_id):
                 raise ValueError("Invalid product ID format")
@@ -108,10 +145,10 @@ class ProductService:
             if "price" in update_data and isinstance(update_data["price"], Decimal):
                 update_data["price"] = float(update_data["price"])
 
-            update_data["updated_at"] = datetime.utcnow()
+            update_data["updated_at"] = datetime.now(timezone.utc)
 
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(product_id)},
+                {"_id": ObjectId(product_id), "owner_id": str(owner_id)},
                 {"$set": update_data},
                 return_document=ReturnDocument.AFTER
             )
@@ -125,20 +162,23 @@ class ProductService:
         except (errors.InvalidId, PyMongoError, ValueError) as e:
             raise Exception(f"Error updating product: {e}")
 
-    async def delete_product(self, product_id: str) -> bool:
-        """Delete a product by its ID."""
+    async def delete_product(self, product_id: str, owner_id: str) -> bool:
+        """Delete a product by its ID if it belongs to `owner_id`."""
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(product_id)})
+            result = await self.collection.delete_one({"_id": ObjectId(product_id), "owner_id": str(owner_id)})
             return result.deleted_count > 0
         except (PyMongoError, ValueError) as e:
             raise Exception(f"Error deleting product: {e}")
 
-    async def get_products_by_name(self, name: str) -> List[ProductSchema]:
-        """Search for products by name (case-insensitive)."""
+    async def get_products_by_name(self, name: str) -> List[dict]:
+        """Search for products by name using the text index, best matches first, returned as raw documents."""
         try:
-            return [
-                ProductSchema(**{**product, "_id": str(product["_id"])})
-                async for product in self.collection.find({"name": {"$regex": name, "$options": "i"}})
-            ]
+            cursor = (
+                self.collection.find({"$text": {"$search": name}}, projection=PRODUCT_LIST_PROJECTION)
+                .sort([("score", {"$meta": "textScore"})])
+                .batch_size(CURSOR_BATCH_SIZE)
+            )
+            # ObjectIds are stringified by the ORJSONResponse encoder
+            return [to_product_row(product) for product in await cursor.to_list(length=None)]
         except PyMongoError as e:
             raise Exception(f"Error searching products by name: {e}")
@@ -1,34 +1,82 @@
+import asyncio
+from typing import Dict, Optional
+
 from bson import ObjectId
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.config import settings
 from src.users.schemas.auth import AuthSchema
 from src.users.services import UserService
 from src.users.utils.password import decode_token
 
 user_service = UserService()
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
 
+# Authenticated users by ID; entries never outlive an access token
+USER_CACHE_TTL_SECONDS = min(60, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_fetches: Dict[str, asyncio.Future] = {}
+
+
+async def get_cached_user(user_id: str) -> Optional[AuthSchema]:
+    """Fetch a user by ID, serving repeat lookups from the in-process TTL cache."""
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    # Concurrent misses for the same user share a single database lookup
+    fetch = _user_fetches.get(user_id)
+    if fetch is None:
+        fetch = asyncio.ensure_future(user_service.get_user_by_id(user_id))
+        _user_fetches[user_id] = fetch
+        fetch.add_done_callback(lambda _: _user_fetches.pop(user_id, None))
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> AuthSchema:
-    """Extract and validate the current user from JWT token."""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    user = await asyncio.shield(fetch)
+    if user is not None:
+        _user_cache[user_id] = user
+    return user
 
+
+def resolve_user_id(token: str) -> Optional[str]:
+    """Decode a bearer token to its user ID, or None when the token is invalid."""
     try:
         user_id: str = decode_token(token)
-        if not user_id or not ObjectId.is_valid(user_id):
-            raise credentials_exception
+    except HTTPException:
+        return None
+
+    if not user_id or not ObjectId.is_valid(user_id):
+        return None
+    return user_id
 
-        # Fetch user from database
-        user_data = await user_service.get_user_by_id(user_id)
-        if not user_data:
-            raise credentials_exception
 
-        return user_data
+async def resolve_user(user_id: str) -> Optional[AuthSchema]:
+    """Fetch the user behind a verified token, or None when it no longer exists or cannot be loaded."""
+    try:
+        # Fetch user from cache or database
+        return await get_cached_user(user_id)
 
     except Exception:
-        raise credentials_exception
+        return None
+
+
+class CurrentUserBearer(OAuth2PasswordBearer):
+    """OAuth2 bearer scheme returning the user behind the token `AuthMiddleware` verified for this request."""
+
+    async def __call__(self, request: Request) -> AuthSchema:
+        # A missing or non-bearer Authorization header keeps OAuth2PasswordBearer's "Not authenticated"
+        await super().__call__(request)
+
+        user_id = request.scope.get("state", {}).get("auth")
+        user = await resolve_user(user_id) if user_id else None
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return user
+
+
+# Route dependency; keeps the OAuth2 security scheme in the OpenAPI docs
+get_current_user = CurrentUserBearer(tokenUrl="api/token", scheme_name="OAuth2PasswordBearer")
@@ -0,0 +1,34 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.users.dependencies.permissions import resolve_user_id
+
+
+def get_bearer_token(scope: Scope) -> str:
+    """Read the bearer token straight from the raw ASGI headers (names are lowercase)."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            if value[:7].lower() == b"bearer ":
+                return value[7:].decode("latin-1")
+            break
+    return ""
+
+
+class AuthMiddleware:
+    """
+    Pure ASGI middleware authenticating the bearer token once per request.
+
+    Stores the verified user ID in `scope["state"]["auth"]`; it is None for missing or
+    invalid tokens. The user itself is only fetched by routes depending on `get_current_user`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            token = get_bearer_token(scope)
+            user_id = resolve_user_id(token) if token else None
+
+            scope.setdefault("state", {})["auth"] = user_id
+
+        await self.app(scope, receive, send)
@@ -2,10 +2,10 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi import Form
-from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import ValidationError
 
+from src.app.responses import ORJSONResponse
 from src.users.schemas.auth import AuthSchema, CreateUserSchema
 from src.users.schemas.token import Token
 from src.users.services import UserService
@@ -23,13 +23,13 @@ async def create_user(data: Annotated[CreateUserSchema, Form()]):
         return user
 
     except ValidationError as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={"detail": e.errors()}
         )
 
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"detail": f"Internal server error: {str(e)}"}
         )
@@ -45,8 +45,6 @@ async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm,
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(
-        data={"sub": str(user.id)},
-    )
+    access_token = create_access_token(sub=str(user.id))
 
     return Token(access_token=access_token, token_type="bearer")
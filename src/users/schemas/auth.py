@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
 
 from bson import ObjectId
@@ -9,8 +10,8 @@ class UserBase(BaseModel):
     email: EmailStr = Field(..., description="The email address of the user.")
     username: constr(min_length=3, max_length=50) = Field(..., description="The unique username of the user.")
     full_name: str = Field(..., description="The full name of the user.")
-    password: Optional[str] = Field(..., min_length=3, max_length=64, exclude=True,
-                                    description="The user's password, which will be hashed and stored.")
+    # The stored bcrypt/Argon2id hash; plaintext length limits live on CreateUserSchema
+    password: Optional[str] = Field(..., exclude=True, description="The user's hashed password.")
 
     @field_validator("username")
     @classmethod
@@ -20,27 +21,19 @@ class UserBase(BaseModel):
             raise ValueError("Username must be alphanumeric (letters and numbers only).")
         return value
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, value: Optional[str]) -> Optional[str]:
-        """Ensure the password meets the minimum length requirement."""
-        if value and len(value) < 3:
-            raise ValueError("Password must be at least 3 characters long.")
-        return value
-
 
 class AuthSchema(UserBase):
     id: str = Field(default_factory=lambda: str(ObjectId()), alias="_id")
     is_active: Optional[bool] = Field(True, description="Whether the user is active or not.")
 
-    created_at: datetime = Field(default_factory=datetime.utcnow,
+    created_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc),
                                  description="Timestamp when the document was created.")
-    updated_at: datetime = Field(default_factory=datetime.utcnow,
+    updated_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc),
                                  description="Timestamp when the document was last updated.")
 
     def update_timestamps(self):
         """Update the `updated_at` field with the current timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
 
     @property
     def is_account_active(self) -> bool:
@@ -48,6 +41,17 @@ class AuthSchema(UserBase):
 
 
 class CreateUserSchema(UserBase):
+    password: Optional[str] = Field(..., min_length=3, max_length=64, exclude=True,
+                                    description="The user's password, which will be hashed and stored.")
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, value: Optional[str]) -> Optional[str]:
+        """Ensure the password meets the minimum length requirement."""
+        if value and len(value) < 3:
+            raise ValueError("Password must be at least 3 characters long.")
+        return value
+
     class Config:
         json_schema_extra = {
             "example": {
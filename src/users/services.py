@@ -1,22 +1,26 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List
 
 from bson import ObjectId
 from fastapi import HTTPException
 from pydantic import EmailStr
-from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError
 
-from src.app.database import MongoDBMotorClient
+from src.app.database import CURSOR_BATCH_SIZE, mongodb
 from src.users.schemas.auth import CreateUserSchema, AuthSchema
-from src.users.utils.password import get_password_hash, verify_password
+from src.users.utils.password import a_get_password_hash, a_verify_password, get_dummy_password_hash, needs_rehash
 
 
 class UserService:
-    def __init__(self):
-        """Initialize UserService with a MongoDBMotorClient instance."""
-        self.db = MongoDBMotorClient().db
-        self.collection = self.db.get_collection("users")
+    @property
+    def collection(self):
+        """The `users` collection of the lifespan-managed MongoDB client."""
+        return mongodb.get_collection("users")
+
+    async def create_indexes(self):
+        """Create the indexes backing username/email lookups and uniqueness."""
+        await self.collection.create_index("username", unique=True)
+        await self.collection.create_index("email", unique=True)
 
     @staticmethod
     async def is_valid_object_id(id: str):
@@ -34,8 +38,8 @@ class UserService:
             ]
         }
 
-        # Perform the query
-        existing_user = await self.collection.find_one(query)
+        # Perform the query, fetching only the fields compared below
+        existing_user = await self.collection.find_one(query, projection={"username": 1, "email": 1, "_id": 0})
 
         if existing_user:
             if existing_user.get('username') == username:
@@ -47,8 +51,21 @@ class UserService:
 
     async def authenticate_user(self, username: str, password: str):
         user = await self.get_user_by_username(username)
-        if not user or not verify_password(password, user.password):
+        if not user:
+            # Spend the same hashing time as a real check so timing does not reveal unknown usernames
+            await a_verify_password(password, get_dummy_password_hash())
+            return None
+        if not await a_verify_password(password, user.password):
             return None
+
+        # Upgrade hashes made with an outdated scheme or cost while the plaintext is at hand
+        if needs_rehash(user.password):
+            user.password = await a_get_password_hash(password)
+            try:
+                await self.collection.update_one({"_id": ObjectId(user.id)}, {"$set": {"password": user.password}})
+            except PyMongoError:
+                pass  # The login still succeeds; the rehash is retried on the next one
+
         return user
 
     async def create_user(self, user_data: CreateUserSchema) -> AuthSchema:
@@ -58,8 +75,8 @@ class UserService:
             user_dict = user_data.model_dump(by_alias=True)
 
             # Assign timestamps
-            user_dict["created_at"] = user_dict["updated_at"] = datetime.utcnow()
-            user_dict["password"] = get_password_hash(user_data.password)
+            user_dict["created_at"] = user_dict["updated_at"] = datetime.now(timezone.utc)
+            user_dict["password"] = await a_get_password_hash(user_data.password)
 
             # Insert user into the database
             result = await self.collection.insert_one(user_dict)
@@ -83,32 +100,25 @@ class UserService:
     async def get_all_users(self) -> List[AuthSchema]:
         """Retrieve all users from the database."""
         try:
-            return [
-                AuthSchema(**{**user, "_id": str(user["_id"])})
-                async for user in self.collection.find()
-            ]
+            users = await self.collection.find().batch_size(CURSOR_BATCH_SIZE).to_list(length=None)
+            return [AuthSchema(**{**user, "_id": str(user["_id"])}) for user in users]
         except PyMongoError as e:
             raise HTTPException(status_code=500, detail=f"Database error while fetching users: {e}")
 
-    async def update_user(self, user_id: str, update_data: dict) -> Optional[AuthSchema]:
-        """Update a user's details."""
+    async def update_user(self, user: AuthSchema, update_data: dict) -> Optional[AuthSchema]:
+        """Update an already fetched user's details and return the merged result."""
         try:
-            if not ObjectId.is_valid(user_id):
+            if not ObjectId.is_valid(user.id):
                 raise HTTPException(status_code=400, detail="Invalid user ID format")
 
-            update_data["updated_at"] = datetime.utcnow()
-
-            result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(user_id)},
-                {"$set": update_data},
-                return_document=ReturnDocument.AFTER
-            )
+            update_data["updated_at"] = datetime.now(timezone.utc)
 
-            if result:
-                result["_id"] = str(result["_id"])
-                return AuthSchema(**result)
+            result = await self.collection.update_one({"_id": ObjectId(user.id)}, {"$set": update_data})
+            if result.matched_count == 0:
+                return None  # User not found
 
-            return None  # User not found
+            # Apply the delta locally instead of reading the document (and password hash) back
+            return user.model_copy(update=update_data)
 
         except (PyMongoError, ValueError) as e:
             raise HTTPException(status_code=500, detail=f"Error updating user: {e}")
@@ -1,49 +1,234 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 
-import jwt
+import bcrypt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TLRUCache, TTLCache
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 
 from src.config import settings
 
 ALGORITHM = "HS256"
 SECRET_KEY = settings.SECRET_KEY
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+VERIFY_CACHE_ENABLED = settings.VERIFY_CACHE_ENABLED
+ARGON2_ENABLED = settings.ARGON2_ENABLED
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_DEFAULT_EXPIRY_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
+# HS256 tokens are signed and verified with the one-shot hmac.digest (OpenSSL's HMAC) using
+# the bytes SECRET_KEY from settings; every token we issue carries this exact header, so
+# verification compares it byte for byte
+_HEADER_B64 = base64.urlsafe_b64encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"})).rstrip(b"=")
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+_MAX_TOKEN_LEN = 4096
 
+# Prebuilt decode failures; FastAPI only reads them, and the traceback is reset on each raise
+_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_EXPIRED_EXC = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired")
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+# bcrypt only uses the first 72 bytes of a password; truncate explicitly as passlib did
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
+# New hashes use Argon2id when ARGON2_ENABLED; stored bcrypt hashes keep verifying and are
+# upgraded on the next successful login
+_ARGON2 = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (expires_delta if expires_delta else timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+# bcrypt and argon2 release the GIL, so hashing on these threads keeps the event loop free and
+# runs concurrent logins in parallel across cores
+_HASHING_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+# sha256(token)[:16] -> (user_id, exp) for verified tokens; an entry lives for at most
+# DECODE_CACHE_TTL_SECONDS and never past its token's own expiry
+DECODE_CACHE_TTL_SECONDS = 60
+_decoded_tokens: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, entry, now: min(now + DECODE_CACHE_TTL_SECONDS, entry[1]),
+    timer=time.time,
+)
+_decoded_tokens_lock = threading.Lock()
+
+# HMAC-SHA256(SECRET_KEY, password) + stored hash -> True for recent successful checks, when
+# VERIFY_CACHE_ENABLED; keyed so the cache never holds a plain fast hash of a password, and
+# failures are never cached so wrong guesses always pay the full hashing cost
+VERIFY_CACHE_TTL_SECONDS = 30
+_verified_passwords: TTLCache = TTLCache(maxsize=1024, ttl=VERIFY_CACHE_TTL_SECONDS)
+_verified_passwords_lock = threading.Lock()
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _hs256_encode(payload: dict) -> str:
+    """Serialize and sign a JWT payload with HMAC-SHA256."""
+    signing_input = _HEADER_B64 + b"." + _b64url_encode(orjson.dumps(payload))
+    signature = hmac.digest(SECRET_KEY, signing_input, "sha256")
+    return (signing_input + b"." + _b64url_encode(signature)).decode()
+
+
+def _hs256_verify(token: str) -> Optional[dict]:
+    """Return the payload of an HS256 token signed with our key, or None if it is malformed or forged."""
+    try:
+        signing_input, signature = token.encode().rsplit(b".", 1)
+        header, payload = signing_input.split(b".")
+    except ValueError:
+        return None
+
+    if header != _HEADER_B64:
+        return None
+
+    expected = _b64url_encode(hmac.digest(SECRET_KEY, signing_input, "sha256"))
+    if not hmac.compare_digest(expected, signature):
+        return None
+
+    try:
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + b"=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def _check_password(password: bytes, hashed_password: bytes) -> bool:
+    """Verify against an Argon2 or bcrypt hash, picked by the hash's prefix."""
+    if hashed_password.startswith(b"$argon2"):
+        try:
+            return _ARGON2.verify(hashed_password, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(password[:BCRYPT_MAX_PASSWORD_BYTES], hashed_password)
+
+
+def verify_password(plain_password: str, hashed_password) -> bool:
+    """
+    Check a password against its Argon2id or bcrypt hash in constant time.
+
+    Both libraries compare digests without early exit; never replace or wrap this with
+    a short-circuiting `==` on hashes or other secrets (use hmac.compare_digest).
+    With VERIFY_CACHE_ENABLED, a pair verified in the last VERIFY_CACHE_TTL_SECONDS skips hashing.
+    """
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode()
+    password = plain_password.encode()
+
+    if not VERIFY_CACHE_ENABLED:
+        return _check_password(password, hashed_password)
+
+    cache_key = hmac.digest(SECRET_KEY, password, "sha256") + hashed_password
+    with _verified_passwords_lock:
+        if cache_key in _verified_passwords:
+            return True
+
+    verified = _check_password(password, hashed_password)
+    if verified:
+        with _verified_passwords_lock:
+            _verified_passwords[cache_key] = True
+    return verified
+
+
+def get_password_hash(password: str) -> str:
+    if ARGON2_ENABLED:
+        return _ARGON2.hash(password)
+    return bcrypt.hashpw(password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+async def a_verify_password(plain_password: str, hashed_password) -> bool:
+    """`verify_password` run on the hashing thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_HASHING_POOL, verify_password, plain_password, hashed_password)
+
+
+async def a_get_password_hash(password: str) -> str:
+    """`get_password_hash` run on the hashing thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_HASHING_POOL, get_password_hash, password)
+
+
+@lru_cache(maxsize=1)
+def get_dummy_password_hash() -> str:
+    """A throwaway hash with the configured scheme and cost, verified against when a login names an unknown user."""
+    return get_password_hash("dummy-password")
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash was made with a scheme or cost other than the configured one."""
+    if hashed_password.startswith("$argon2"):
+        try:
+            return not ARGON2_ENABLED or _ARGON2.check_needs_rehash(hashed_password)
+        except InvalidHashError:
+            return True
+    if ARGON2_ENABLED:
+        return True
+
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def create_access_token(*, sub: str, expires_delta: Optional[timedelta] = None, **extra_claims) -> str:
+    # `sub` is bound by its own parameter; `exp` must come from expires_delta, never extra_claims
+    if "exp" in extra_claims:
+        raise TypeError("create_access_token() sets the 'exp' claim itself; pass expires_delta instead")
+
+    # `exp` is a NumericDate (seconds since the epoch)
+    expire = int(time.time()) + (int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_EXPIRY_SECONDS)
+    to_encode = {**extra_claims, "sub": sub, "exp": expire}
+
+    encoded_jwt = _hs256_encode(to_encode)
     return encoded_jwt
 
 
 def decode_token(token: str) -> Optional[str]:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: Optional[str] = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        return user_id
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired")
-    except jwt.InvalidTokenError:
-        raise credentials_exception
+    # Our tokens are a few hundred bytes; reject empty or oversized input before hashing it
+    if not token or len(token) > _MAX_TOKEN_LEN:
+        raise _CREDENTIALS_EXC.with_traceback(None)
+
+    cache_key = hashlib.sha256(token.encode()).digest()[:16]
+    with _decoded_tokens_lock:
+        cached = _decoded_tokens.get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    payload = _hs256_verify(token)
+    if payload is None:
+        raise _CREDENTIALS_EXC.with_traceback(None)
+
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        raise _CREDENTIALS_EXC.with_traceback(None)
+    if exp <= time.time():
+        raise _EXPIRED_EXC.with_traceback(None)
+
+    user_id: Optional[str] = payload.get("sub")
+    if not isinstance(user_id, str):
+        raise _CREDENTIALS_EXC.with_traceback(None)
+
+    with _decoded_tokens_lock:
+        _decoded_tokens[cache_key] = (user_id, exp)
+    return user_id
+
+
+def warmup():
+    """
+    Do the one-time setup work of the auth primitives at startup rather than on the first request.
+
+    Computes the dummy hash used for unknown-user logins (a full-cost bcrypt run) and
+    round-trips a token through the HS256 signer.
+    """
+    get_dummy_password_hash()
+    _hs256_verify(_hs256_encode({"sub": "warmup", "exp": 0}))
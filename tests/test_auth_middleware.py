@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.users.dependencies import permissions
+from src.users.middleware import AuthMiddleware
+from src.users.schemas.auth import AuthSchema
+from src.users.utils.password import create_access_token
+
+USER_ID = "65f000000000000000000001"
+
+
+class AuthMiddlewareLookupTest(unittest.TestCase):
+    def setUp(self):
+        self.lookups = []
+        user = AuthSchema(_id=USER_ID, email="user@example.com", username="user123", full_name="John Doe",
+                          password="hash")
+
+        async def get_user_by_id(user_id):
+            self.lookups.append(user_id)
+            return user if user_id == USER_ID else None
+
+        lookup_patch = patch.object(permissions.user_service, "get_user_by_id", get_user_by_id)
+        lookup_patch.start()
+        self.addCleanup(lookup_patch.stop)
+        permissions._user_cache.clear()
+
+        app = FastAPI()
+        app.add_middleware(AuthMiddleware)
+
+        @app.get("/public")
+        async def public():
+            return {"ok": True}
+
+        @app.get("/me")
+        async def me(current_user=Depends(permissions.get_current_user)):
+            return {"id": current_user.id}
+
+        self.client = TestClient(app)
+        self.auth_headers = {"Authorization": f"Bearer {create_access_token(sub=USER_ID)}"}
+
+    def test_request_without_token_makes_no_lookup(self):
+        self.assertEqual(self.client.get("/public").status_code, 200)
+        self.assertEqual(self.client.get("/me").status_code, 401)
+        self.assertEqual(self.lookups, [])
+
+    def test_missing_and_invalid_tokens_keep_their_messages(self):
+        for headers, detail in (
+            ({}, "Not authenticated"),
+            ({"Authorization": "Basic dXNlcjpwYXNz"}, "Not authenticated"),
+            ({"Authorization": "Bearer junk"}, "Could not validate credentials"),
+        ):
+            with self.subTest(headers=headers):
+                response = self.client.get("/me", headers=headers)
+                self.assertEqual(response.status_code, 401)
+                self.assertEqual(response.json(), {"detail": detail})
+                self.assertEqual(response.headers["WWW-Authenticate"], "Bearer")
+
+    def test_public_route_with_token_makes_no_lookup(self):
+        self.assertEqual(self.client.get("/public", headers=self.auth_headers).status_code, 200)
+        self.assertEqual(self.client.get("/missing", headers=self.auth_headers).status_code, 404)
+        self.assertEqual(self.lookups, [])
+
+    def test_protected_route_looks_the_user_up(self):
+        response = self.client.get("/me", headers=self.auth_headers)
+
+        self.assertEqual(response.json(), {"id": USER_ID})
+        self.assertEqual(self.lookups, [USER_ID])
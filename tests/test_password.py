@@ -0,0 +1,180 @@
+import hmac
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+import orjson
+from fastapi import HTTPException
+
+from src.users.utils import password
+
+try:
+    import jwt
+except ImportError:  # PyJWT is a dev dependency, used only as the HS256 reference
+    jwt = None
+
+USER_ID = "65f000000000000000000001"
+
+
+def sign(header: bytes, payload: bytes, key: bytes = None) -> str:
+    """Build an HS256 token from raw JSON header/payload bytes, signed with `key` (our key by default)."""
+    signing_input = password._b64url_encode(header) + b"." + password._b64url_encode(payload)
+    signature = hmac.digest(key or password.SECRET_KEY, signing_input, "sha256")
+    return (signing_input + b"." + password._b64url_encode(signature)).decode()
+
+
+def sign_claims(claims: dict, header: dict = None) -> str:
+    return sign(orjson.dumps(header or {"alg": "HS256", "typ": "JWT"}), orjson.dumps(claims))
+
+
+class DecodeTokenTest(unittest.TestCase):
+    def setUp(self):
+        password._decoded_tokens.clear()
+
+    def assertRejected(self, token: str, detail: str = "Could not validate credentials"):
+        with self.assertRaises(HTTPException) as raised:
+            password.decode_token(token)
+        self.assertEqual(raised.exception.status_code, 401)
+        self.assertEqual(raised.exception.detail, detail)
+
+    def test_round_trip(self):
+        token = password.create_access_token(sub=USER_ID, role="admin")
+
+        self.assertEqual(password.decode_token(token), USER_ID)
+        self.assertEqual(password._hs256_verify(token)["role"], "admin")
+
+    def test_tampered_signature_is_rejected(self):
+        token = password.create_access_token(sub=USER_ID)
+        signing_input, signature = token.rsplit(".", 1)
+        flipped = signature[:10] + ("A" if signature[10] != "A" else "B") + signature[11:]
+
+        self.assertRejected(f"{signing_input}.{flipped}")
+
+    def test_tampered_payload_is_rejected(self):
+        token = password.create_access_token(sub=USER_ID)
+        header, _, signature = token.split(".")
+        payload = password._b64url_encode(orjson.dumps({"sub": "65f000000000000000000002", "exp": 2**31})).decode()
+
+        self.assertRejected(f"{header}.{payload}.{signature}")
+
+    def test_other_key_is_rejected(self):
+        claims = {"sub": USER_ID, "exp": int(time.time()) + 60}
+        token = sign(orjson.dumps({"alg": "HS256", "typ": "JWT"}), orjson.dumps(claims), key=b"another-key")
+
+        self.assertRejected(token)
+
+    def test_unexpected_header_is_rejected(self):
+        claims = {"sub": USER_ID, "exp": int(time.time()) + 60}
+        for header in (
+            b'{"alg":"HS512","typ":"JWT"}',
+            b'{"alg":"none","typ":"JWT"}',
+            b'{"alg":"HS256","typ":"JWS"}',
+            b'{"alg":"HS256"}',
+            b'{"typ":"JWT","alg":"HS256"}',
+            b'{"alg": "HS256", "typ": "JWT"}',
+        ):
+            with self.subTest(header=header):
+                self.assertRejected(sign(header, orjson.dumps(claims)))
+
+    def test_padded_header_encoding_is_rejected(self):
+        token = password.create_access_token(sub=USER_ID)
+        header, payload, _ = token.split(".")
+        padded_header = header + "=" * (-len(header) % 4 or 4)
+        signing_input = f"{padded_header}.{payload}".encode()
+        signature = password._b64url_encode(hmac.digest(password.SECRET_KEY, signing_input, "sha256")).decode()
+
+        self.assertRejected(f"{padded_header}.{payload}.{signature}")
+
+    def test_malformed_payload_is_rejected(self):
+        header = orjson.dumps({"alg": "HS256", "typ": "JWT"})
+        for payload in (b"not json", b"[1, 2]", b'"sub"', b"null"):
+            with self.subTest(payload=payload):
+                self.assertRejected(sign(header, payload))
+
+    def test_malformed_token_is_rejected(self):
+        for token in ("junk", "a.b", "a.b.c.d", "..."):
+            with self.subTest(token=token):
+                self.assertRejected(token)
+
+    def test_missing_or_non_numeric_exp_is_rejected(self):
+        for claims in ({"sub": USER_ID}, {"sub": USER_ID, "exp": "tomorrow"}, {"sub": USER_ID, "exp": None}):
+            with self.subTest(claims=claims):
+                self.assertRejected(sign_claims(claims))
+
+    def test_expired_token_is_rejected(self):
+        self.assertRejected(sign_claims({"sub": USER_ID, "exp": int(time.time()) - 1}), "Token has expired")
+        self.assertRejected(password.create_access_token(sub=USER_ID, expires_delta=timedelta(seconds=-5)),
+                            "Token has expired")
+
+    def test_missing_or_non_string_sub_is_rejected(self):
+        exp = int(time.time()) + 60
+        for claims in ({"exp": exp}, {"sub": 123, "exp": exp}, {"sub": None, "exp": exp}):
+            with self.subTest(claims=claims):
+                self.assertRejected(sign_claims(claims))
+
+    def test_empty_and_oversized_tokens_are_rejected(self):
+        self.assertRejected("")
+        self.assertRejected("a" * (password._MAX_TOKEN_LEN + 1))
+
+    def test_cached_decode_expires_with_the_token(self):
+        token = password.create_access_token(sub=USER_ID, expires_delta=timedelta(seconds=1))
+        exp = password._hs256_verify(token)["exp"]
+
+        self.assertEqual(password.decode_token(token), USER_ID)
+        self.assertEqual(password.decode_token(token), USER_ID)  # served from the cache
+
+        time.sleep(max(0.0, exp - time.time()) + 0.05)
+        self.assertRejected(token, "Token has expired")
+
+
+class HS256InteropTest(unittest.TestCase):
+    def setUp(self):
+        password._decoded_tokens.clear()
+
+    def test_known_vector_verifies(self):
+        # The widely published example token for the key "your-256-bit-secret"
+        token = (
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+            ".eyJzdWIiOiIxMjM0NTY3ODkwIiwibmFtZSI6IkpvaG4gRG9lIiwiaWF0IjoxNTE2MjM5MDIyfQ"
+            ".SflKxwRJSMeKKF2QT4fwpMeJf36POk6yJV_adQssw5c"
+        )
+        with patch.object(password, "SECRET_KEY", b"your-256-bit-secret"):
+            self.assertEqual(
+                password._hs256_verify(token),
+                {"sub": "1234567890", "name": "John Doe", "iat": 1516239022},
+            )
+            self.assertEqual(password._hs256_encode({"sub": "1234567890", "name": "John Doe", "iat": 1516239022}), token)
+
+    @unittest.skipIf(jwt is None, "PyJWT is not installed")
+    def test_tokens_interoperate_with_pyjwt(self):
+        ours = password.create_access_token(sub=USER_ID, role="admin")
+        claims = jwt.decode(ours, password.SECRET_KEY, algorithms=["HS256"])
+        self.assertEqual(claims["sub"], USER_ID)
+        self.assertEqual(claims["role"], "admin")
+        self.assertEqual(jwt.get_unverified_header(ours), {"alg": "HS256", "typ": "JWT"})
+
+        theirs = jwt.encode({"sub": USER_ID, "exp": int(time.time()) + 60}, password.SECRET_KEY, algorithm="HS256")
+        self.assertEqual(password.decode_token(theirs), USER_ID)
+
+
+class VerifyCacheTest(unittest.TestCase):
+    def setUp(self):
+        password._verified_passwords.clear()
+        cache_patch = patch.object(password, "VERIFY_CACHE_ENABLED", True)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.addCleanup(password._verified_passwords.clear)
+
+    def test_only_successes_are_cached_under_a_keyed_digest(self):
+        hashed = password.get_password_hash("securepassword")
+
+        self.assertFalse(password.verify_password("wrongpassword", hashed))
+        self.assertEqual(len(password._verified_passwords), 0)
+
+        self.assertTrue(password.verify_password("securepassword", hashed))
+        self.assertEqual(
+            list(password._verified_passwords),
+            [hmac.digest(password.SECRET_KEY, b"securepassword", "sha256") + hashed.encode()],
+        )
+        self.assertTrue(password.verify_password("securepassword", hashed))
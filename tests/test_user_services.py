@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+
+from bson import ObjectId
+
+from src.users.schemas.auth import CreateUserSchema
+from src.users.services import UserService
+from src.users.utils import password
+
+
+class FakeUsersCollection:
+    """Just enough of the `users` collection for UserService's single-document calls."""
+
+    def __init__(self):
+        self.documents = {}
+
+    def _match(self, query):
+        for document in self.documents.values():
+            if all(document.get(field) == value for field, value in query.items()):
+                return document
+        return None
+
+    async def find_one(self, query, projection=None):
+        document = self._match(query)
+        return dict(document) if document else None
+
+    async def insert_one(self, document):
+        document["_id"] = ObjectId()
+        self.documents[document["_id"]] = dict(document)
+        return type("InsertOneResult", (), {"inserted_id": document["_id"]})()
+
+    async def update_one(self, query, update):
+        document = self._match(query)
+        if document:
+            document.update(update["$set"])
+        return type("UpdateResult", (), {"matched_count": int(document is not None)})()
+
+
+class Argon2UserRoundTripTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.collection = FakeUsersCollection()
+        collection_patch = patch.object(UserService, "collection", property(lambda _: self.collection))
+        argon2_patch = patch.object(password, "ARGON2_ENABLED", True)
+        collection_patch.start()
+        argon2_patch.start()
+        self.addCleanup(collection_patch.stop)
+        self.addCleanup(argon2_patch.stop)
+        self.service = UserService()
+
+    async def test_registered_argon2_user_loads_by_username_and_id(self):
+        created = await self.service.create_user(CreateUserSchema(
+            email="user@example.com", username="user123", full_name="John Doe", password="securepassword",
+        ))
+        self.assertTrue(created.password.startswith("$argon2id$"))
+
+        by_username = await self.service.get_user_by_username("user123")
+        by_id = await self.service.get_user_by_id(created.id)
+        self.assertEqual(by_username.password, created.password)
+        self.assertEqual(by_id.password, created.password)
+        self.assertIsNotNone(await self.service.authenticate_user("user123", "securepassword"))
+
+    async def test_bcrypt_user_upgraded_on_login_still_loads(self):
+        with patch.object(password, "ARGON2_ENABLED", False):
+            hashed = password.get_password_hash("securepassword")
+        result = await self.collection.insert_one({
+            "email": "user@example.com", "username": "user123", "full_name": "John Doe", "password": hashed,
+        })
+
+        self.assertIsNotNone(await self.service.authenticate_user("user123", "securepassword"))
+        upgraded = await self.service.get_user_by_id(str(result.inserted_id))
+        self.assertTrue(upgraded.password.startswith("$argon2id$"))
+        self.assertIsNotNone(await self.service.authenticate_user("user123", "securepassword"))